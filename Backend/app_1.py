@@ -1,25 +1,46 @@
 from flask import Flask, jsonify, request
+from collections import deque
 from dataclasses import dataclass, asdict
-from typing import Dict, List, Optional
+from typing import Deque, Dict, Optional
+import itertools
+import asyncio
+import concurrent.futures
 import threading
 import time
 import random
+import numpy as np
+import orjson
 import requests
-import uuid
+from requests.adapters import HTTPAdapter, Retry
+import secrets
 from datetime import datetime
 import logging
+import logging.handlers
+import queue
 
 # Add CORS support for frontend
 from flask_cors import CORS
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Set up logging. Records go through a queue to a listener thread, so a
+# trading loop or request handler never blocks on stream I/O (the handler
+# lock on stdout is a real choke point with many traders logging at once).
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_output = logging.StreamHandler()
+_log_output.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+# The QueueHandler must stay formatter-less (added to the root directly,
+# not via basicConfig): its prepare() bakes any formatter into the queued
+# record, and the listener's StreamHandler would then format it a second
+# time, doubling the prefix.
+logging.root.setLevel(logging.INFO)
+logging.root.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_output)
+_log_listener.start()
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     id: str
     signal: str
@@ -32,8 +53,28 @@ class Trade:
     status: str = "open"
     exit_price: Optional[float] = None
     pnl: float = 0.0
+    # Dict form cached at close time; declared as a field since slots
+    # classes cannot grow attributes dynamically
+    _json_cache: Optional[dict] = None
 
-@dataclass
+    def to_dict(self) -> dict:
+        # Explicit build - asdict() reflects over fields per call and
+        # would leak the private cache field into the payload
+        return {
+            'id': self.id,
+            'signal': self.signal,
+            'entry_price': self.entry_price,
+            'quantity': self.quantity,
+            'leverage': self.leverage,
+            'stop_loss': self.stop_loss,
+            'take_profit': self.take_profit,
+            'timestamp': self.timestamp,
+            'status': self.status,
+            'exit_price': self.exit_price,
+            'pnl': self.pnl,
+        }
+
+@dataclass(slots=True)
 class Signal:
     id: str
     direction: str
@@ -43,45 +84,210 @@ class Signal:
     long_ratio: float
     short_ratio: float
 
+# One pooled session shared by every trader: keep-alive connections to
+# Binance avoid a fresh TCP+TLS handshake on each price poll
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.2)
+))
+
+# Short-TTL price cache shared by all traders in this process: N traders
+# polling the same symbol cost one Binance call per TTL window instead of N.
+# (A Redis instance would extend this across processes; in-process is enough
+# for the single-process deployment here and needs no extra service.)
+_PRICE_TTL = 2.0
+_price_cache: Dict[str, tuple] = {}  # symbol -> (expiry monotonic ts, price)
+_price_cache_lock = threading.Lock()
+
+# Single background poller: one 1 Hz Binance request feeds every trader
+# and endpoint, replacing K independent polls and staying well inside
+# Binance rate limits. Publishes (monotonic ts, price) per symbol; a dict
+# store is a single atomic reference swap, so readers need no lock.
+_POLL_INTERVAL = 1.0
+_POLL_FRESH = 3.0  # readers fall back to a direct fetch beyond this age
+_latest_price: Dict[str, tuple] = {}
+
+
+def _price_poller():
+    url = "https://api.binance.com/api/v3/ticker/price?symbol=EPICUSDT"
+    while True:
+        try:
+            response = _session.get(url, timeout=(2, 5))
+            response.raise_for_status()
+            _latest_price["EPICUSDT"] = (time.monotonic(), float(response.json()['price']))
+        except Exception as e:
+            # Keep the last published value; readers fall back to their own
+            # fetch once it goes stale
+            logger.debug("Price poller fetch failed: %s", e)
+        time.sleep(_POLL_INTERVAL)
+
+
+threading.Thread(target=_price_poller, name="price-poller", daemon=True).start()
+
+# All trading loops run as coroutines on one shared event loop thread.
+# A sleeping trader costs a suspended coroutine instead of a parked OS
+# thread (~KB vs ~8MB stack), so the process scales to many traders.
+# Blocking HTTP still goes through the loop's default executor since the
+# requests/Flask stack is synchronous.
+_loop = asyncio.new_event_loop()
+
+# Bounded pool backing the loop's run_in_executor calls: many traders
+# ticking at once fan their blocking fetches out over these workers
+# (capped so a Binance stall cannot pile up unbounded threads) instead
+# of the loop's unbounded default executor.
+_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=16, thread_name_prefix="trader-io"
+)
+_loop.set_default_executor(_executor)
+
+threading.Thread(target=_loop.run_forever, name="trading-loop", daemon=True).start()
+
+def _exit_reason(is_long: bool, price: float, stop_loss: float, take_profit: float) -> str:
+    """Exit decision for one trade as a pure function of four scalars.
+
+    Kept free of object access so it could be batch-evaluated (or JIT
+    compiled) over arrays of positions; with active trades capped at 2
+    per trader, the scalar form is already the fast path.
+    """
+    if is_long:
+        if price <= stop_loss:
+            return "Stop Loss"
+        if price >= take_profit:
+            return "Take Profit"
+    else:
+        if price >= stop_loss:
+            return "Stop Loss"
+        if price <= take_profit:
+            return "Take Profit"
+    return ""
+
+
 class EnhancedTrader:
+    # Shared across instances so all traders draw from the same pool
+    _session = _session
+
     def __init__(self, trader_id: str):
         self.id = trader_id
         self.balance = 1000.0
         self.initial_balance = 1000.0
         self.max_balance = 1000.0
-        self.trades: List[Trade] = []
-        self.signals: List[Signal] = []
-        self.active_trades: List[Trade] = []
+        # Bounded histories: long-running traders evict their oldest
+        # entries instead of growing without limit
+        self.trades: Deque[Trade] = deque(maxlen=10000)
+        self.signals: Deque[Signal] = deque(maxlen=1000)
+        # Closed-trade PnLs in a growable float64 buffer so /summary can
+        # compute the win rate with one vectorized comparison instead of
+        # scanning the trades list in Python. The buffer spans the trader's
+        # whole lifetime (8 bytes per closed trade - the bounded deques are
+        # what evict the heavyweight objects), so win-rate stats must use
+        # the lifetime trade counter, not the capped deque length.
+        self._pnl_buf = np.zeros(64, dtype=np.float64)
+        self._pnl_len = 0
+        self._lifetime_trades = 0  # every trade ever opened, never evicted
+        # Keyed by trade id: O(1) removal in close_trade vs list scans
+        self.active_trades: Dict[str, Trade] = {}
         self.is_running = False
-        self.thread = None
+        self.task: Optional[concurrent.futures.Future] = None
         self.last_error = None
+        # Last price seen by the trading loop; /summary serves this
+        # instead of touching the network in a request handler
+        self.last_price = 1.0
         
         # Risk parameters
         self.base_risk = 0.05
         self.base_reward = 0.15
         self.leverage = 10
         self.symbol = "EPICUSDT"
+
+        # Drawdown bands with their SL/TP price multipliers precomputed:
+        # (upper drawdown bound, risk, reward,
+        #  long SL/TP multiplier, short SL/TP multiplier)
+        inv_lev = 1.0 / self.leverage
+        self._rr_bands = tuple(
+            (bound, risk, reward,
+             1 - risk * inv_lev, 1 + reward * inv_lev,   # LONG SL/TP
+             1 + risk * inv_lev, 1 - reward * inv_lev)   # SHORT SL/TP
+            for bound, risk, reward in (
+                (0.05, self.base_risk, self.base_reward),
+                (0.15, 0.08, 0.25),
+                (0.25, 0.12, 0.40),
+                (float('inf'), 0.15, 0.50),
+            )
+        )
         
-        # Signal tracking
+        # Signal tracking. Counters are written from the trading loop and
+        # read from Flask request threads, so mutations go through
+        # _record_signal under the lock; ratios are maintained
+        # incrementally instead of being re-derived per call.
         self.long_count = 0
         self.short_count = 0
-        
-        logger.info(f"Created new trader: {trader_id}")
+        self._total_signals = 0
+        self._long_ratio = 0.0
+        self._short_ratio = 0.0
+        self._counter_lock = threading.Lock()
+
+        # Monotonic sequence for trade/signal ids: no urandom syscall or
+        # UUID formatting per signal, and unique per trader by construction
+        self._id_seq = 0
+
+        # Per-trader RNG: concurrent loops don't contend on the module
+        # global random instance's lock
+        self._rng = random.Random()
+
+        logger.info("Created new trader: %s", trader_id)
     
+    def _next_id(self) -> str:
+        self._id_seq += 1
+        return f"{self.id}-{self._id_seq:x}"
+
+    def _record_signal(self, direction: str):
+        """Count a signal and refresh the cached ratios atomically"""
+        with self._counter_lock:
+            if direction == "LONG":
+                self.long_count += 1
+            else:
+                self.short_count += 1
+            self._total_signals = self.long_count + self.short_count
+            self._long_ratio = self.long_count / self._total_signals
+            self._short_ratio = self.short_count / self._total_signals
+
+    def _reset_signal_counters(self):
+        """Zero the counters and cached ratios (force-balance endpoint)"""
+        with self._counter_lock:
+            self.long_count = 0
+            self.short_count = 0
+            self._total_signals = 0
+            self._long_ratio = 0.0
+            self._short_ratio = 0.0
+
     def get_current_price(self) -> float:
         """Get EPICUSDT price from Binance with better error handling"""
+        # Fast path: the background poller keeps this fresh, so the common
+        # case is a dict read with zero I/O
+        published = _latest_price.get(self.symbol)
+        if published is not None and time.monotonic() - published[0] < _POLL_FRESH:
+            return published[1]
+
+        cached = _price_cache.get(self.symbol)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
         try:
             url = "https://api.binance.com/api/v3/ticker/price?symbol=EPICUSDT"
-            response = requests.get(url, timeout=10)
+            response = self._session.get(url, timeout=(2, 5))
             response.raise_for_status()
             price = float(response.json()['price'])
-            logger.debug(f"Current EPICUSDT price: ${price}")
+            with _price_cache_lock:
+                _price_cache[self.symbol] = (time.monotonic() + _PRICE_TTL, price)
+            logger.debug("Current EPICUSDT price: $%s", price)
             return price
         except requests.exceptions.RequestException as e:
-            logger.warning(f"Failed to fetch price from Binance: {e}")
+            logger.warning("Failed to fetch price from Binance: %s", e)
             return 1.0  # Fallback price
         except (KeyError, ValueError) as e:
-            logger.warning(f"Invalid price data from Binance: {e}")
+            logger.warning("Invalid price data from Binance: %s", e)
             return 1.0
     
     def calculate_drawdown(self) -> float:
@@ -91,31 +297,28 @@ class EnhancedTrader:
         return max(0, (self.max_balance - self.balance) / self.max_balance)
     
     def get_dynamic_risk_reward(self) -> tuple:
-        """Dynamic risk-reward based on drawdown"""
+        """Risk-reward band for the current drawdown, with the SL/TP
+        multipliers already computed: (risk, reward, long_sl, long_tp,
+        short_sl, short_tp)"""
         drawdown = self.calculate_drawdown()
-        
-        if drawdown < 0.05:  # 0-5%
-            return self.base_risk, self.base_reward
-        elif drawdown < 0.15:  # 5-15%
-            return 0.08, 0.25
-        elif drawdown < 0.25:  # 15-25%
-            return 0.12, 0.40
-        else:  # >25%
-            return 0.15, 0.50
+        for band in self._rr_bands:
+            if drawdown < band[0]:
+                return band[1:]
+        return self._rr_bands[-1][1:]
     
     def generate_signal(self) -> Signal:
         """Generate balanced LONG/SHORT signals with intelligent rebalancing"""
         try:
             price = self.get_current_price()
-            total_signals = self.long_count + self.short_count
-            
-            # Calculate ratios
-            long_ratio = self.long_count / max(total_signals, 1)
-            short_ratio = self.short_count / max(total_signals, 1)
-            
+            total_signals = self._total_signals
+
+            # Ratios are maintained incrementally by _record_signal
+            long_ratio = self._long_ratio
+            short_ratio = self._short_ratio
+
             # Signal generation logic
             if total_signals < 10:
-                direction = random.choice(["LONG", "SHORT"])
+                direction = self._rng.choice(["LONG", "SHORT"])
                 confidence = 0.5
             elif long_ratio > 0.6:
                 direction = "SHORT"
@@ -124,19 +327,17 @@ class EnhancedTrader:
                 direction = "LONG"
                 confidence = 0.8
             else:
-                # Weighted random based on imbalance
-                weights = [short_ratio, long_ratio]
-                direction = random.choices(["LONG", "SHORT"], weights=weights)[0]
+                # Weighted random based on imbalance: the ratios sum to 1,
+                # so P(LONG) = short_ratio and one uniform draw decides -
+                # no cumulative-weights list per call as with choices()
+                direction = "LONG" if self._rng.random() < short_ratio else "SHORT"
                 confidence = 0.6
             
             # Update counters
-            if direction == "LONG":
-                self.long_count += 1
-            else:
-                self.short_count += 1
-            
+            self._record_signal(direction)
+
             signal = Signal(
-                id=str(uuid.uuid4())[:8],
+                id=self._next_id(),
                 direction=direction,
                 price=price,
                 confidence=confidence,
@@ -146,68 +347,69 @@ class EnhancedTrader:
             )
             
             self.signals.append(signal)
-            logger.info(f"Generated {direction} signal at ${price}")
+            logger.info("Generated %s signal at $%s", direction, price)
             return signal
             
         except Exception as e:
-            logger.error(f"Error generating signal: {e}")
+            logger.error("Error generating signal: %s", e)
             self.last_error = f"Signal generation error: {e}"
             raise
     
     def execute_trade(self, signal: Signal) -> Optional[Trade]:
         """Execute trade based on signal with enhanced validation and logging"""
         try:
-            logger.info(f"Attempting to execute {signal.direction} trade for trader {self.id}")
+            logger.info("Attempting to execute %s trade for trader %s", signal.direction, self.id)
             
             # Enhanced validation checks
             if len(self.active_trades) >= 2:
-                logger.warning(f"Max active trades reached: {len(self.active_trades)}")
+                logger.warning("Max active trades reached: %d", len(self.active_trades))
                 self.last_error = "Maximum active trades (2) reached"
                 return None
             
             if self.balance <= 50:  # Increased minimum balance
-                logger.warning(f"Insufficient balance: ${self.balance}")
+                logger.warning("Insufficient balance: $%s", self.balance)
                 self.last_error = f"Insufficient balance: ${self.balance}"
                 return None
             
             if signal.price <= 0:
-                logger.error(f"Invalid signal price: {signal.price}")
+                logger.error("Invalid signal price: %s", signal.price)
                 self.last_error = f"Invalid signal price: {signal.price}"
                 return None
             
-            risk_pct, reward_pct = self.get_dynamic_risk_reward()
-            logger.info(f"Using risk: {risk_pct*100:.1f}%, reward: {reward_pct*100:.1f}%")
+            (risk_pct, reward_pct,
+             long_sl, long_tp, short_sl, short_tp) = self.get_dynamic_risk_reward()
+            logger.info("Using risk: %.1f%%, reward: %.1f%%", risk_pct * 100, reward_pct * 100)
             
             # Calculate position details with enhanced safety checks
             risk_amount = min(self.balance * risk_pct, self.balance * 0.15)  # Cap at 15%
             
             if signal.direction == "LONG":
-                stop_loss = signal.price * (1 - risk_pct / self.leverage)
-                take_profit = signal.price * (1 + reward_pct / self.leverage)
+                stop_loss = signal.price * long_sl
+                take_profit = signal.price * long_tp
             else:
-                stop_loss = signal.price * (1 + risk_pct / self.leverage)
-                take_profit = signal.price * (1 - reward_pct / self.leverage)
+                stop_loss = signal.price * short_sl
+                take_profit = signal.price * short_tp
             
             # Enhanced validation for stop loss and take profit
             if stop_loss <= 0 or take_profit <= 0:
-                logger.error(f"Invalid SL/TP: SL={stop_loss}, TP={take_profit}")
+                logger.error("Invalid SL/TP: SL=%s, TP=%s", stop_loss, take_profit)
                 self.last_error = f"Invalid stop loss or take profit calculated"
                 return None
             
             # Check if SL and TP make sense
             if signal.direction == "LONG" and stop_loss >= signal.price:
-                logger.error(f"Invalid LONG SL: {stop_loss} >= {signal.price}")
+                logger.error("Invalid LONG SL: %s >= %s", stop_loss, signal.price)
                 self.last_error = "Invalid stop loss for LONG position"
                 return None
             
             if signal.direction == "SHORT" and stop_loss <= signal.price:
-                logger.error(f"Invalid SHORT SL: {stop_loss} <= {signal.price}")
+                logger.error("Invalid SHORT SL: %s <= %s", stop_loss, signal.price)
                 self.last_error = "Invalid stop loss for SHORT position"
                 return None
             
             stop_loss_pct = abs(signal.price - stop_loss) / signal.price
             if stop_loss_pct == 0 or stop_loss_pct > 0.2:  # Max 20% risk
-                logger.error(f"Invalid stop loss percentage: {stop_loss_pct*100:.2f}%")
+                logger.error("Invalid stop loss percentage: %.2f%%", stop_loss_pct * 100)
                 self.last_error = f"Stop loss percentage out of range: {stop_loss_pct*100:.2f}%"
                 return None
                 
@@ -215,7 +417,7 @@ class EnhancedTrader:
             quantity = max(0.01, position_value / signal.price * 0.9)  # Increased minimum quantity
             
             trade = Trade(
-                id=str(uuid.uuid4())[:8],
+                id=self._next_id(),
                 signal=signal.direction,
                 entry_price=signal.price,
                 quantity=quantity,
@@ -226,10 +428,11 @@ class EnhancedTrader:
             )
             
             self.trades.append(trade)
-            self.active_trades.append(trade)
+            self._lifetime_trades += 1
+            self.active_trades[trade.id] = trade
             
-            logger.info(f"Trade executed successfully: {trade.id} - {signal.direction} at ${signal.price}")
-            logger.info(f"SL: ${stop_loss:.4f}, TP: ${take_profit:.4f}, Qty: {quantity:.4f}")
+            logger.info("Trade executed successfully: %s - %s at $%s", trade.id, signal.direction, signal.price)
+            logger.info("SL: $%.4f, TP: $%.4f, Qty: %.4f", stop_loss, take_profit, quantity)
             
             self.last_error = None  # Clear any previous errors
             return trade
@@ -240,36 +443,22 @@ class EnhancedTrader:
             self.last_error = error_msg
             return None
     
-    def check_trade_exits(self):
-        """Check if any trades should be closed with better logging"""
+    def check_trade_exits(self, current_price: float):
+        """Check if any trades should be closed with better logging.
+
+        Takes the already-fetched price so one HTTP request drives the
+        whole tick instead of each step re-polling Binance.
+        """
         try:
-            current_price = self.get_current_price()
-            
-            for trade in self.active_trades[:]:
-                should_close = False
-                exit_reason = ""
-                
-                if trade.signal == "LONG":
-                    if current_price <= trade.stop_loss:
-                        should_close = True
-                        exit_reason = "Stop Loss"
-                    elif current_price >= trade.take_profit:
-                        should_close = True
-                        exit_reason = "Take Profit"
-                else:  # SHORT
-                    if current_price >= trade.stop_loss:
-                        should_close = True
-                        exit_reason = "Stop Loss"
-                    elif current_price <= trade.take_profit:
-                        should_close = True
-                        exit_reason = "Take Profit"
-                
-                if should_close:
-                    logger.info(f"Closing trade {trade.id} due to {exit_reason}")
+            for trade in list(self.active_trades.values()):
+                exit_reason = _exit_reason(trade.signal == "LONG", current_price,
+                                           trade.stop_loss, trade.take_profit)
+                if exit_reason:
+                    logger.info("Closing trade %s due to %s", trade.id, exit_reason)
                     self.close_trade(trade, current_price, exit_reason)
                     
         except Exception as e:
-            logger.error(f"Error checking trade exits: {e}")
+            logger.error("Error checking trade exits: %s", e)
             self.last_error = f"Trade exit check error: {e}"
     
     def close_trade(self, trade: Trade, exit_price: float, reason: str):
@@ -291,67 +480,86 @@ class EnhancedTrader:
             self.balance += trade.pnl
             self.max_balance = max(self.max_balance, self.balance)
             
-            logger.info(f"Trade {trade.id} closed: {reason}")
-            logger.info(f"PnL: ${trade.pnl:.2f}, Balance: ${old_balance:.2f} → ${self.balance:.2f}")
+            logger.info("Trade %s closed: %s", trade.id, reason)
+            logger.info("PnL: $%.2f, Balance: $%.2f → $%.2f", trade.pnl, old_balance, self.balance)
             
+            # Closed trades never change again, so serialize once here
+            # instead of running asdict() reflection on every /trades call
+            trade._json_cache = trade.to_dict()
+
+            # Record PnL in the stats buffer (doubled when full)
+            if self._pnl_len == len(self._pnl_buf):
+                self._pnl_buf = np.concatenate([self._pnl_buf, np.zeros_like(self._pnl_buf)])
+            self._pnl_buf[self._pnl_len] = trade.pnl
+            self._pnl_len += 1
+
             # Remove from active trades
-            if trade in self.active_trades:
-                self.active_trades.remove(trade)
+            self.active_trades.pop(trade.id, None)
                 
         except Exception as e:
-            logger.error(f"Error closing trade: {e}")
+            logger.error("Error closing trade: %s", e)
             self.last_error = f"Trade close error: {e}"
     
     def get_roe(self) -> float:
         """Calculate Return on Equity"""
         return ((self.balance - self.initial_balance) / self.initial_balance) * 100
     
-    def trading_loop(self):
-        """Main trading loop with enhanced error handling"""
-        logger.info(f"Starting trading loop for trader {self.id}")
-        
+    async def trading_loop(self):
+        """Main trading loop with enhanced error handling.
+
+        Runs as a coroutine on the shared event loop; the blocking HTTP
+        calls are pushed onto the loop's executor so a slow Binance
+        response never stalls the other traders' loops.
+        """
+        logger.info("Starting trading loop for trader %s", self.id)
+        loop = asyncio.get_running_loop()
+
         while self.is_running:
             try:
-                # Check existing trades
-                self.check_trade_exits()
-                
+                # One price fetch drives the whole tick
+                current_price = await loop.run_in_executor(None, self.get_current_price)
+                self.last_price = current_price
+
+                # Check existing trades (pure computation once the price is in hand)
+                self.check_trade_exits(current_price)
+
                 # Generate new trade (20% probability, reduced for stability)
-                if random.random() < 0.2 and len(self.active_trades) < 2:
+                if self._rng.random() < 0.2 and len(self.active_trades) < 2:
                     logger.info("Attempting to generate new trade...")
-                    signal = self.generate_signal()
+                    signal = await loop.run_in_executor(None, self.generate_signal)
                     trade = self.execute_trade(signal)
-                    
+
                     if trade:
-                        logger.info(f"New trade executed: {trade.id}")
+                        logger.info("New trade executed: %s", trade.id)
                     else:
                         logger.warning("Failed to execute new trade")
-                
+
                 # Stop if target achieved or balance too low
                 if self.get_roe() >= 100:
-                    logger.info(f"Target ROE achieved! Current ROE: {self.get_roe():.2f}%")
+                    logger.info("Target ROE achieved! Current ROE: %.2f%%", self.get_roe())
                     self.is_running = False
                     break
-                
+
                 if self.balance <= 10:
-                    logger.warning(f"Balance too low: ${self.balance}, stopping trading")
+                    logger.warning("Balance too low: $%s, stopping trading", self.balance)
                     self.is_running = False
                     break
-                    
-                time.sleep(15)  # Wait 15 seconds
-                
+
+                await asyncio.sleep(15)  # Wait 15 seconds
+
             except Exception as e:
                 error_msg = f"Trading loop error: {str(e)}"
                 logger.error(error_msg)
                 self.last_error = error_msg
-                time.sleep(5)
-                
-        logger.info(f"Trading loop stopped for trader {self.id}")
+                await asyncio.sleep(5)
+
+        logger.info("Trading loop stopped for trader %s", self.id)
     
     def start_trading(self):
         """Start automated trading with validation"""
         try:
             if self.is_running:
-                logger.warning(f"Trading already running for trader {self.id}")
+                logger.warning("Trading already running for trader %s", self.id)
                 return False
                 
             if self.balance <= 50:
@@ -360,12 +568,10 @@ class EnhancedTrader:
                 self.last_error = error_msg
                 return False
             
-            logger.info(f"Starting automated trading for trader {self.id}")
+            logger.info("Starting automated trading for trader %s", self.id)
             self.is_running = True
             self.last_error = None
-            self.thread = threading.Thread(target=self.trading_loop)
-            self.thread.daemon = True
-            self.thread.start()
+            self.task = asyncio.run_coroutine_threadsafe(self.trading_loop(), _loop)
             return True
             
         except Exception as e:
@@ -377,33 +583,53 @@ class EnhancedTrader:
     def stop_trading(self):
         """Stop trading and close all positions"""
         try:
-            logger.info(f"Stopping trading for trader {self.id}")
+            logger.info("Stopping trading for trader %s", self.id)
             self.is_running = False
             current_price = self.get_current_price()
             
-            for trade in self.active_trades[:]:
+            for trade in list(self.active_trades.values()):
                 self.close_trade(trade, current_price, "Manual Close")
                 
-            if self.thread and self.thread.is_alive():
-                self.thread.join(timeout=5)
+            if self.task is not None and not self.task.done():
+                try:
+                    self.task.result(timeout=5)
+                except concurrent.futures.TimeoutError:
+                    # Loop is mid-sleep; it will observe is_running and exit
+                    pass
                 
-            logger.info(f"Trading stopped for trader {self.id}")
+            logger.info("Trading stopped for trader %s", self.id)
             
         except Exception as e:
-            logger.error(f"Error stopping trading: {e}")
+            logger.error("Error stopping trading: %s", e)
             self.last_error = f"Stop trading error: {e}"
 
-# Global traders storage
+def _json(obj):
+    """Serialize a response body with orjson (C-speed, native dataclass
+    and NumPy support) instead of jsonify's stdlib encoder"""
+    return app.response_class(orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY),
+                              mimetype='application/json')
+
+
+# Global traders storage.
+#
+# Trader state is deliberately in-process: the trading loops, price poller
+# and executor all live in this process, so the app must run single-worker
+# (waitress/gthread, not forking workers). Moving state to an external
+# store (e.g. Redis hashes per trader) is what would unlock multi-worker
+# deployment and durability across restarts. Registry mutations are
+# guarded so concurrent create/delete requests cannot race.
 traders: Dict[str, EnhancedTrader] = {}
+_traders_lock = threading.Lock()
 
 # API Endpoints with enhanced error handling
 @app.route('/api/trader/create', methods=['POST'])
 def create_trader():
     try:
-        trader_id = str(uuid.uuid4())[:8]
-        traders[trader_id] = EnhancedTrader(trader_id)
+        trader_id = secrets.token_hex(4)
+        with _traders_lock:
+            traders[trader_id] = EnhancedTrader(trader_id)
         logger.info(f"Created new trader: {trader_id}")
-        return jsonify({"trader_id": trader_id, "status": "created"})
+        return _json({"trader_id": trader_id, "status": "created"})
     except Exception as e:
         logger.error(f"Error creating trader: {e}")
         return jsonify({"error": f"Failed to create trader: {str(e)}"}), 500
@@ -418,7 +644,7 @@ def start_trader(trader_id):
         success = trader.start_trading()
         
         if success:
-            return jsonify({
+            return _json({
                 "status": "started", 
                 "target_roe": "100%",
                 "balance": trader.balance,
@@ -442,7 +668,7 @@ def stop_trader(trader_id):
             return jsonify({"error": "Trader not found"}), 404
         
         traders[trader_id].stop_trading()
-        return jsonify({"status": "stopped"})
+        return _json({"status": "stopped"})
         
     except Exception as e:
         logger.error(f"Error stopping trader {trader_id}: {e}")
@@ -455,25 +681,29 @@ def get_summary(trader_id):
             return jsonify({"error": "Trader not found"}), 404
         
         trader = traders[trader_id]
-        total_trades = len(trader.trades)
-        winning_trades = len([t for t in trader.trades if t.pnl > 0])
+        # Lifetime counter, not len(trades): the deque evicts old entries,
+        # and a capped denominator against the lifetime win count would
+        # drift the rate upward past 100%
+        total_trades = trader._lifetime_trades
+        winning_trades = int(np.count_nonzero(trader._pnl_buf[:trader._pnl_len] > 0))
         win_rate = (winning_trades / max(total_trades, 1)) * 100
         
-        return jsonify({
+        # No round() calls: the dashboard formats numbers client-side
+        return _json({
             "trader_id": trader_id,
-            "balance": round(trader.balance, 2),
-            "roe": round(trader.get_roe(), 2),
+            "balance": trader.balance,
+            "roe": trader.get_roe(),
             "target_roe": 100.0,
-            "drawdown": round(trader.calculate_drawdown() * 100, 2),
+            "drawdown": trader.calculate_drawdown() * 100,
             "total_trades": total_trades,
             "active_trades": len(trader.active_trades),
-            "win_rate": round(win_rate, 1),
+            "win_rate": win_rate,
             "signals_generated": len(trader.signals),
             "long_signals": trader.long_count,
             "short_signals": trader.short_count,
             "signal_balance": f"{trader.long_count}/{trader.short_count}",
             "is_running": trader.is_running,
-            "current_price": trader.get_current_price(),
+            "current_price": trader.last_price,
             "last_error": trader.last_error
         })
         
@@ -488,8 +718,9 @@ def get_trades(trader_id):
             return jsonify({"error": "Trader not found"}), 404
         
         trader = traders[trader_id]
-        return jsonify({
-            "trades": [asdict(trade) for trade in trader.trades],
+        return _json({
+            "trades": [trade._json_cache or trade.to_dict()
+                       for trade in trader.trades],
             "total_trades": len(trader.trades),
             "active_trades": len(trader.active_trades)
         })
@@ -505,8 +736,9 @@ def get_signals(trader_id):
             return jsonify({"error": "Trader not found"}), 404
         
         trader = traders[trader_id]
-        return jsonify({
-            "signals": [asdict(signal) for signal in trader.signals[-20:]],  # Last 20 signals
+        return _json({
+            "signals": [asdict(signal) for signal in itertools.islice(
+                trader.signals, max(0, len(trader.signals) - 20), len(trader.signals))],  # Last 20 signals
             "total_signals": len(trader.signals),
             "balance_ratio": f"L:{trader.long_count} S:{trader.short_count}"
         })
@@ -522,10 +754,9 @@ def force_balance(trader_id):
             return jsonify({"error": "Trader not found"}), 404
         
         trader = traders[trader_id]
-        trader.long_count = 0
-        trader.short_count = 0
+        trader._reset_signal_counters()
         logger.info(f"Reset signal balance for trader {trader_id}")
-        return jsonify({"status": "signals_reset", "balance": "0/0"})
+        return _json({"status": "signals_reset", "balance": "0/0"})
         
     except Exception as e:
         logger.error(f"Error resetting balance for {trader_id}: {e}")
@@ -534,7 +765,7 @@ def force_balance(trader_id):
 @app.route('/api/traders', methods=['GET'])
 def list_traders():
     try:
-        return jsonify({
+        return _json({
             "traders": list(traders.keys()),
             "total": len(traders)
         })
@@ -570,27 +801,24 @@ def manual_trade(trader_id):
         # Create manual signal
         current_price = trader.get_current_price()
         signal = Signal(
-            id=str(uuid.uuid4())[:8],
+            id=trader._next_id(),
             direction=direction,
             price=current_price,
             confidence=0.9,
             timestamp=datetime.now().isoformat(),
-            long_ratio=trader.long_count / max(len(trader.signals), 1),
-            short_ratio=trader.short_count / max(len(trader.signals), 1)
+            long_ratio=trader._long_ratio,
+            short_ratio=trader._short_ratio
         )
-        
+
         trader.signals.append(signal)
-        if direction == "LONG":
-            trader.long_count += 1
-        else:
-            trader.short_count += 1
+        trader._record_signal(direction)
         
         # Execute trade
         trade = trader.execute_trade(signal)
         
         if trade:
             logger.info(f"Manual trade executed: {trade.id}")
-            return jsonify({
+            return _json({
                 "status": "trade_executed",
                 "trade_id": trade.id,
                 "signal": direction,
@@ -609,13 +837,14 @@ def manual_trade(trader_id):
 @app.route('/api/trader/<trader_id>/delete', methods=['DELETE'])
 def delete_trader(trader_id):
     try:
-        if trader_id not in traders:
+        with _traders_lock:
+            trader = traders.pop(trader_id, None)
+        if trader is None:
             return jsonify({"error": "Trader not found"}), 404
-        
-        traders[trader_id].stop_trading()
-        del traders[trader_id]
+
+        trader.stop_trading()
         logger.info(f"Deleted trader: {trader_id}")
-        return jsonify({"status": "deleted"})
+        return _json({"status": "deleted"})
         
     except Exception as e:
         logger.error(f"Error deleting trader {trader_id}: {e}")
@@ -624,7 +853,7 @@ def delete_trader(trader_id):
 # Health check endpoint
 @app.route('/api/health', methods=['GET'])
 def health_check():
-    return jsonify({
+    return _json({
         "status": "healthy",
         "active_traders": len(traders),
         "timestamp": datetime.now().isoformat()
@@ -635,4 +864,15 @@ if __name__ == '__main__':
     print("📊 Target: 100% ROE through intelligent risk management")
     print("⚖️  Features: Balanced signals, dynamic scaling, drawdown recovery")
     print("🔧 Enhanced: Better error handling, logging, and validation")
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    # The Werkzeug dev server is single-threaded, so a slow Binance fetch
+    # in one /summary call would block every other request. Prefer waitress
+    # when installed; otherwise run threaded without debug (the reloader
+    # would import the module - and start the trading event loop - twice).
+    # For managed deployments: gunicorn -k gthread --threads 32 app_1:app
+    # (gevent workers would monkey-patch threading and break the shared
+    # asyncio loop thread, so stick to thread-based workers).
+    try:
+        from waitress import serve
+        serve(app, host='0.0.0.0', port=5000, threads=16)
+    except ImportError:
+        app.run(debug=False, host='0.0.0.0', port=5000, threaded=True)
\ No newline at end of file